@@ -1,4 +1,5 @@
 from .bolt_client import Client, create_client
+from .async_client import AsyncClient, create_async_client
 from .bolt_schemas import FleetOrder, Vehicle, PortalStatus, Driver, FleetStateLog
 
-__all__ = ["Client", "create_client", "FleetOrder", "Vehicle", "PortalStatus", "Driver", "FleetStateLog"]
\ No newline at end of file
+__all__ = ["Client", "create_client", "AsyncClient", "create_async_client", "FleetOrder", "Vehicle", "PortalStatus", "Driver", "FleetStateLog"]
\ No newline at end of file
@@ -0,0 +1,305 @@
+import asyncio
+import httpx
+import orjson
+import logging
+from .bolt_client import (
+    DEFAULT_TIMEOUT, ENDPOINTS, OIDC_TOKEN_URL, _default_time_range, _error_body, _load_env, _parse,
+    _token_rejected, _token_request_body, _token_expiry, _token_is_fresh, _load_cached_token, _store_cached_token
+)
+from .bolt_schemas import FleetOrder, Vehicle, PortalStatus, Driver, FleetStateLog
+from typing import List, Optional, Tuple, Union
+import os
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+class AsyncClient:
+    """Asynchronous client for interacting with Bolt Fleet Integration API.
+
+    Async counterpart of `Client`. All requests go through a single pooled
+    `httpx.AsyncClient`, so independent calls can run concurrently (see
+    `get_all`) instead of paying one round-trip after another. The access
+    token is fetched lazily on first use (or taken from the disk cache shared
+    with `Client`) and refreshed shortly before it expires, or when the API
+    reports it as expired or invalid; concurrent refreshes are coalesced
+    behind an `asyncio.Lock`.
+
+    Attributes:
+        base_url: Base URL for the Bolt API
+        client_id: OAuth client ID for authentication
+        client_secret: OAuth client secret for authentication
+        access_token: Current access token (automatically refreshed when needed)
+        timeout: Timeout in seconds applied to every HTTP request, either a
+            single number or a (connect, read) tuple
+    """
+
+    def __init__(self, timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT):
+        _load_env()
+        self.client_id = os.getenv("BOLT_CLIENT_ID")
+        self.client_secret = os.getenv("BOLT_CLIENT_SECRET")
+        self.base_url = os.getenv("BOLT_API_URL")
+        self.timeout = timeout
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            http_timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        else:
+            http_timeout = httpx.Timeout(timeout)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url or "",
+            headers={"Content-Type": "application/json"},
+            timeout=http_timeout,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+        # Separate client for OIDC so it never carries the API Authorization header
+        self._oidc_client = httpx.AsyncClient(
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=http_timeout
+        )
+        self._oidc_body = _token_request_body(self.client_id, self.client_secret)
+        self.access_token = None
+        self._token_exp = None
+        cached = _load_cached_token(self.client_id)
+        if cached:
+            self.access_token, self._token_exp = cached
+        self._token_lock = asyncio.Lock()
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """Current access token used to authenticate API requests."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, token: Optional[str]):
+        # Keep the client's Authorization header in step with the token
+        self._access_token = token
+        if token:
+            self._client.headers["Authorization"] = f"Bearer {token}"
+        else:
+            self._client.headers.pop("Authorization", None)
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying HTTP clients.
+
+        Releases all pooled connections held by the client. The client
+        should not be used after calling this method.
+        """
+        await self._client.aclose()
+        await self._oidc_client.aclose()
+
+    async def get_access_token(self) -> str:
+        """Get a new access token from Bolt OIDC.
+
+        Requests a new access token using client credentials grant type.
+        The token is used for authenticating subsequent API requests.
+
+        Returns:
+            str: The access token string
+
+        Raises:
+            Exception: If the token request fails or no token is received
+        """
+        logger.debug("Requesting new access token from Bolt OIDC")
+        response = await self._oidc_client.post(OIDC_TOKEN_URL, content=self._oidc_body)
+        if response.status_code != 200:
+            body = _error_body(response)
+            logger.error("Failed to get access token: %s %s", response.status_code, body)
+            raise Exception(f"Failed to get access token: {response.status_code} {body}")
+        token_response = _parse(response)
+        token = token_response.get("access_token")
+        if not token:
+            raise Exception("No access token received in response")
+        logger.debug("Successfully obtained access token")
+        self._token_exp = _token_expiry(token, token_response)
+        _store_cached_token(self.client_id, token, self._token_exp)
+        return token
+
+    async def _ensure_token(self):
+        """Ensure a valid access token is set. Refresh if missing or expiring.
+
+        Private method that fetches a new token if none is set or the current
+        one is about to expire. Concurrent callers wait on the same lock, so
+        only one of them hits OIDC.
+        """
+        if _token_is_fresh(self.access_token, self._token_exp):
+            return
+        async with self._token_lock:
+            if not _token_is_fresh(self.access_token, self._token_exp):
+                self.access_token = await self.get_access_token()
+
+    async def _refresh_token_if_needed(self, response, sent_token: str) -> bool:
+        """Check if token needs refresh based on response and refresh if needed.
+
+        Analyzes the API response to determine if the access token has expired
+        or is invalid. If so, refreshes the token unless another coroutine
+        already did so while this request was in flight.
+
+        Args:
+            response: The HTTP response object from the API request
+            sent_token: The access token the request was sent with
+
+        Returns:
+            bool: True if the request should be retried with a new token,
+                False otherwise
+        """
+        if not _token_rejected(response):
+            return False
+        async with self._token_lock:
+            if self.access_token == sent_token:
+                logger.warning("Access token expired or invalid, refreshing...")
+                self.access_token = await self.get_access_token()
+        return True
+
+    async def _post(self, path: str, payload: dict) -> list:
+        """POST to an API endpoint and parse the returned records.
+
+        Retries once after a token refresh. The list validator and the key
+        of the record list are looked up in `ENDPOINTS`.
+
+        Args:
+            path: Endpoint path relative to `base_url` (e.g. "/getDrivers")
+            payload: JSON request body
+
+        Returns:
+            list: Parsed model instances for the returned records
+
+        Raises:
+            Exception: If the API request fails or returns an error status code
+        """
+        records_adapter, data_key, label = ENDPOINTS[path]
+        request_body = orjson.dumps(payload)
+        await self._ensure_token()
+
+        # First attempt
+        token = self.access_token
+        response = await self._client.post(path, content=request_body)
+
+        # Refresh token if needed and retry once
+        if await self._refresh_token_if_needed(response, token):
+            logger.debug("Retrying request with new token...")
+            response = await self._client.post(path, content=request_body)
+
+        if response.status_code != 200:
+            body = _error_body(response)
+            logger.error("Failed to get %s: %s %s", label, response.status_code, body)
+            raise Exception(f"Failed to get {label}: {response.status_code} {body}")
+        return records_adapter.validate_python(_parse(response).get("data", {}).get(data_key, []))
+
+    async def get_fleet_orders(self, offset: int, limit: int, company_ids: List[int], start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> List[FleetOrder]:
+        """Get fleet orders from Bolt API with automatic token refresh.
+
+        See `Client.get_fleet_orders` for argument details.
+        """
+        # Use default one-day interval if timestamps not provided
+        start_ts, end_ts = _default_time_range(start_ts, end_ts)
+
+        return await self._post("/getFleetOrders", {
+            "offset": offset,
+            "limit": limit,
+            "company_ids": company_ids,
+            "start_ts": start_ts,
+            "end_ts": end_ts,
+            "time_range_filter_type": "price_review"
+        })
+
+    async def get_vehicles(self, offset: int, limit: int, company_id: int, portal_status: PortalStatus, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> List[Vehicle]:
+        """Get vehicles from Bolt API with automatic token refresh.
+
+        See `Client.get_vehicles` for argument details.
+        """
+        # Use default one-day interval if timestamps not provided
+        start_ts, end_ts = _default_time_range(start_ts, end_ts)
+
+        # Handle portal_status - support both enum and direct values
+        portal_status_value = getattr(portal_status, 'value', portal_status)
+
+        return await self._post("/getVehicles", {
+            "offset": offset,
+            "limit": limit,
+            "company_id": company_id,
+            "start_ts": start_ts,
+            "end_ts": end_ts,
+            "portal_status": portal_status_value
+        })
+
+    async def get_drivers(self, offset: int, limit: int, company_id: int, portal_status: PortalStatus, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> List[Driver]:
+        """Get drivers from Bolt API with automatic token refresh.
+
+        See `Client.get_drivers` for argument details.
+        """
+        # Use default one-day interval if timestamps not provided
+        start_ts, end_ts = _default_time_range(start_ts, end_ts)
+
+        # Handle portal_status - support both enum and direct values
+        portal_status_value = getattr(portal_status, 'value', portal_status)
+
+        return await self._post("/getDrivers", {
+            "offset": offset,
+            "limit": limit,
+            "company_id": company_id,
+            "start_ts": start_ts,
+            "end_ts": end_ts,
+            "portal_status": portal_status_value
+        })
+
+    async def get_fleet_state_logs(self, offset: int, limit: int, company_id: int, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> List[FleetStateLog]:
+        """Get fleet state logs from Bolt API with automatic token refresh.
+
+        See `Client.get_fleet_state_logs` for argument details.
+        """
+        # Use default one-day interval if timestamps not provided
+        start_ts, end_ts = _default_time_range(start_ts, end_ts)
+
+        return await self._post("/getFleetStateLogs", {
+            "offset": offset,
+            "limit": limit,
+            "company_id": company_id,
+            "start_ts": start_ts,
+            "end_ts": end_ts
+        })
+
+    async def get_all(self, offset: int, limit: int, company_id: int, portal_status: PortalStatus, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> Tuple[List[FleetOrder], List[Vehicle], List[Driver], List[FleetStateLog]]:
+        """Fetch orders, vehicles, drivers and state logs concurrently.
+
+        Issues all four requests at once, so the total latency is that of
+        the slowest request rather than the sum of all four.
+
+        Args:
+            offset: Number of records to skip (for pagination)
+            limit: Maximum number of records to return per endpoint
+            company_id: Company ID to filter all results
+            portal_status: Portal status filter for vehicles and drivers
+            start_ts: Start timestamp (Unix timestamp in seconds). Defaults to
+                24 hours ago if not provided.
+            end_ts: End timestamp (Unix timestamp in seconds). Defaults to
+                current time if not provided.
+
+        Returns:
+            Tuple of (orders, vehicles, drivers, state logs)
+
+        Raises:
+            Exception: If any of the API requests fails
+        """
+        # Fetch the token up front so the four requests don't race for it
+        await self._ensure_token()
+        orders, vehicles, drivers, logs = await asyncio.gather(
+            self.get_fleet_orders(offset, limit, [company_id], start_ts, end_ts),
+            self.get_vehicles(offset, limit, company_id, portal_status, start_ts, end_ts),
+            self.get_drivers(offset, limit, company_id, portal_status, start_ts, end_ts),
+            self.get_fleet_state_logs(offset, limit, company_id, start_ts, end_ts)
+        )
+        return orders, vehicles, drivers, logs
+
+
+def create_async_client() -> AsyncClient:
+    """Create a new AsyncClient instance.
+
+    Returns:
+        AsyncClient: A new AsyncClient instance
+    """
+    return AsyncClient()
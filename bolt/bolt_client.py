@@ -1,42 +1,364 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging 
+import base64
+import json
+import orjson
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from .bolt_schemas import FleetOrder, Vehicle, PortalStatus, Driver, FleetStateLog
-from typing import List, Optional
-from datetime import datetime, timedelta
+from pydantic import TypeAdapter
+from typing import Callable, List, Optional, Tuple, Union
 import os
-from dotenv import load_dotenv
-load_dotenv()
+from urllib.parse import urlencode
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# Leave logging configuration to the host application
+logger.addHandler(logging.NullHandler())
+
+OIDC_TOKEN_URL = "https://oidc.bolt.eu/token"
+
+# (connect, read) timeout in seconds for every HTTP request
+DEFAULT_TIMEOUT = (5, 30)
+
+# Maximum number of response body bytes included in error messages
+ERROR_BODY_LIMIT = 500
+
+# Refresh the access token this many seconds before it actually expires
+TOKEN_EXPIRY_MARGIN = 30
+TOKEN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "bolt_client", "token.json")
+
+# Validators for whole response lists, built once at import
+_FLEET_ORDER_LIST = TypeAdapter(List[FleetOrder])
+_VEHICLE_LIST = TypeAdapter(List[Vehicle])
+_DRIVER_LIST = TypeAdapter(List[Driver])
+_FLEET_STATE_LOG_LIST = TypeAdapter(List[FleetStateLog])
+
+# Endpoint path -> (list validator, key of the record list in "data", name used in errors)
+ENDPOINTS = {
+    "/getFleetOrders": (_FLEET_ORDER_LIST, "orders", "fleet orders"),
+    "/getVehicles": (_VEHICLE_LIST, "vehicles", "vehicles"),
+    "/getDrivers": (_DRIVER_LIST, "drivers", "drivers"),
+    "/getFleetStateLogs": (_FLEET_STATE_LOG_LIST, "state_logs", "fleet state logs"),
+}
+
+# Length of the default query window used when timestamps are omitted
+DEFAULT_TIME_RANGE = 24 * 60 * 60
+
+
+def _load_env():
+    """Load a .env file if any Bolt setting is missing from the environment.
+    
+    Deployed processes usually have the variables injected already, so
+    dotenv is only imported, and the filesystem only searched, when needed.
+    """
+    if not all(os.getenv(name) for name in ("BOLT_CLIENT_ID", "BOLT_CLIENT_SECRET", "BOLT_API_URL")):
+        from dotenv import load_dotenv
+        load_dotenv()
+
+
+def _default_time_range(start_ts: Optional[int], end_ts: Optional[int]) -> Tuple[int, int]:
+    """Fill in missing query timestamps.
+    
+    Args:
+        start_ts: Start timestamp (Unix timestamp in seconds) or None for
+            `DEFAULT_TIME_RANGE` seconds ago
+        end_ts: End timestamp (Unix timestamp in seconds) or None for now
+        
+    Returns:
+        Tuple[int, int]: The (start_ts, end_ts) pair to send to the API
+    """
+    now = int(time.time())
+    if start_ts is None:
+        start_ts = now - DEFAULT_TIME_RANGE
+    if end_ts is None:
+        end_ts = now
+    return start_ts, end_ts
+
+
+def _parse(response) -> dict:
+    """Decode a JSON response body with orjson.
+    
+    The decoded body is cached on the response object, so checking a
+    response for token errors and then reading its data parses it only once.
+    
+    Args:
+        response: The HTTP response object from the API request
+        
+    Returns:
+        dict: The decoded JSON body
+        
+    Raises:
+        orjson.JSONDecodeError: If the body is not valid JSON
+    """
+    parsed = getattr(response, "_parsed", None)
+    if parsed is None:
+        parsed = orjson.loads(response.content)
+        response._parsed = parsed
+    return parsed
+
+
+def _token_request_body(client_id: Optional[str], client_secret: Optional[str]) -> bytes:
+    """Encode the client credentials grant sent to Bolt OIDC.
+    
+    The body never changes for a given client, so it is encoded once and
+    reused for every token refresh.
+    """
+    fields = {
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "grant_type": "client_credentials",
+        "scope": "fleet-integration:api"
+    }
+    return urlencode({key: value for key, value in fields.items() if value is not None}).encode()
+
+
+def _error_body(response) -> str:
+    """Get the start of a failed response's body for error messages.
+    
+    Only the first `ERROR_BODY_LIMIT` bytes are decoded, so a large error
+    page doesn't end up in full in logs and exception messages.
+    """
+    return response.content[:ERROR_BODY_LIMIT].decode("utf-8", errors="replace")
+
+
+def _token_rejected(response) -> bool:
+    """Check whether the API rejected the access token of a request.
+    
+    HTTP 401 is decided from the status code alone, without touching the
+    body. The API also reports expired tokens as `code` 503 in the JSON
+    body, so successful and 5xx responses are checked for that; the body is
+    decoded through `_parse`, so on success the caller reuses the decoded
+    data instead of paying for a second parse. Other 4xx responses are
+    never token errors and are not decoded.
+    
+    Args:
+        response: The HTTP response object from the API request
+        
+    Returns:
+        bool: True if the token was rejected, False otherwise
+    """
+    status_code = response.status_code
+    if status_code == 401:
+        return True
+    if status_code != 200 and status_code < 500:
+        return False
+    try:
+        return _parse(response).get("code") == 503
+    except Exception:
+        # Not a JSON object, so not a token error
+        return False
+
+
+def _token_expiry(token: str, token_response: dict) -> Optional[float]:
+    """Work out when an access token expires.
+    
+    Reads the `exp` claim from the JWT payload. Falls back to the
+    `expires_in` field of the token response if the token is not a
+    decodable JWT.
+    
+    Args:
+        token: The access token string
+        token_response: The parsed JSON body of the OIDC token response
+        
+    Returns:
+        Optional[float]: Expiry as a Unix timestamp, or None if unknown
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except Exception:
+        pass
+    expires_in = token_response.get("expires_in")
+    if expires_in is not None:
+        return time.time() + float(expires_in)
+    return None
+
+
+def _token_is_fresh(token: Optional[str], token_exp: Optional[float]) -> bool:
+    """Check whether a token is set and not about to expire.
+    
+    Tokens with an unknown expiry are treated as fresh; the 401 retry
+    path still catches them once they go stale.
+    """
+    if not token:
+        return False
+    return token_exp is None or time.time() < token_exp - TOKEN_EXPIRY_MARGIN
+
+
+def _load_cached_token(client_id: Optional[str]) -> Optional[Tuple[str, Optional[float]]]:
+    """Load a still-valid access token for `client_id` from the disk cache.
+    
+    Returns:
+        Optional[Tuple[str, Optional[float]]]: (token, expiry) or None if
+            there is no usable cached token
+    """
+    try:
+        with open(TOKEN_CACHE_PATH) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("client_id") != client_id:
+        return None
+    token, token_exp = cached.get("access_token"), cached.get("exp")
+    # Treat anything malformed as a cache miss; only tokens with a known
+    # expiry are ever written
+    if not isinstance(token, str) or not isinstance(token_exp, (int, float)) or isinstance(token_exp, bool):
+        return None
+    if not _token_is_fresh(token, token_exp):
+        return None
+    return token, token_exp
+
+
+def _store_cached_token(client_id: Optional[str], token: str, token_exp: Optional[float]):
+    """Write an access token to the disk cache, readable by the owner only.
+    
+    Tokens with an unknown expiry are not cached, since a later client
+    could not tell when they go stale. Failures are logged and otherwise
+    ignored; the cache is only an optimisation.
+    """
+    if token_exp is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(TOKEN_CACHE_PATH), exist_ok=True)
+        fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"client_id": client_id, "access_token": token, "exp": token_exp}, f)
+    except OSError as e:
+        logger.warning("Failed to cache access token: %s", e)
+
 
 class Client:
     """Client for interacting with Bolt Fleet Integration API.
     
     This client handles authentication, token management, and provides methods
     to retrieve fleet orders, vehicles, drivers, and fleet state logs from
-    the Bolt API. It automatically manages access token refresh when tokens
-    expire or become invalid.
+    the Bolt API. Access tokens are refreshed shortly before they expire,
+    and again if the API still reports them as expired or invalid. Tokens
+    are cached on disk so new clients can reuse a still-valid token.
     
     Attributes:
         base_url: Base URL for the Bolt API
         client_id: OAuth client ID for authentication
         client_secret: OAuth client secret for authentication
         access_token: Current access token (automatically refreshed when needed)
+        timeout: Timeout in seconds applied to every HTTP request, either a
+            single number or a (connect, read) tuple
     """
     
-    def __init__(self):
+    def __init__(self, timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT):
+        _load_env()
         self.client_id = os.getenv("BOLT_CLIENT_ID")
         self.client_secret = os.getenv("BOLT_CLIENT_SECRET")
         self.base_url = os.getenv("BOLT_API_URL")
+        self.timeout = timeout
+        # Full endpoint URLs, built once since base_url doesn't change
+        self._urls = {path: f"{self.base_url}{path}" for path in ENDPOINTS}
+        
+        # Shared session so API calls reuse pooled keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        # requests already advertises br when the optional brotli package is
+        # installed; the encoding actually used is logged once, on the first call
+        self._logged_encoding = False
+        self._pool_lock = threading.Lock()
+        self._mount_adapter(pool_maxsize=20)
+        
+        # Separate session for OIDC: different host, and it must not carry
+        # the API Authorization header
+        self._oidc_session = requests.Session()
+        self._oidc_session.headers.update({"Content-Type": "application/x-www-form-urlencoded"})
+        self._oidc_body = _token_request_body(self.client_id, self.client_secret)
+        
         self.access_token = None
+        self._token_exp = None
+        # Serializes token refreshes across threads (e.g. pagination workers)
+        self._refresh_lock = threading.Lock()
+        
+        # Reuse a still-valid token from a previous client if there is one
+        cached = _load_cached_token(self.client_id)
+        if cached:
+            self.access_token, self._token_exp = cached
+        
         self._ensure_token()
 
+    @property
+    def access_token(self) -> Optional[str]:
+        """Current access token used to authenticate API requests."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, token: Optional[str]):
+        # Keep the session's Authorization header in step with the token, so
+        # it is built once per token rather than once per request
+        self._access_token = token
+        if token:
+            self._session.headers["Authorization"] = f"Bearer {token}"
+        else:
+            self._session.headers.pop("Authorization", None)
+
+    def _mount_adapter(self, pool_maxsize: int):
+        """Mount a pooled, retrying HTTP adapter on the session.
+        
+        Args:
+            pool_maxsize: Maximum number of connections kept per host
+        """
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                # The API endpoints are read-only queries, so POSTs are safe to retry.
+                # 503 is left out: the API also uses it to report expired tokens,
+                # which _refresh_token_if_needed handles.
+                allowed_methods=frozenset({"POST"}),
+                status_forcelist=[502, 504],
+                # Hand the last response to the normal error path instead of raising RetryError
+                raise_on_status=False
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._pool_maxsize = pool_maxsize
+
+    def _ensure_pool_size(self, pool_maxsize: int):
+        """Grow the session's connection pool to at least `pool_maxsize`.
+        
+        The pool only ever grows, so concurrent callers swap the adapter at
+        most once per size increase. The replaced adapter is closed: its
+        idle connections are dropped and requests still in flight on it
+        finish normally.
+        
+        Args:
+            pool_maxsize: Minimum number of connections kept per host
+        """
+        with self._pool_lock:
+            if self._pool_maxsize >= pool_maxsize:
+                return
+            old_adapter = self._session.get_adapter("https://")
+            self._mount_adapter(pool_maxsize)
+            old_adapter.close()
+
+    def close(self):
+        """Close the underlying HTTP sessions.
+        
+        Releases all pooled connections held by the client. The client
+        should not be used after calling this method.
+        """
+        self._session.close()
+        self._oidc_session.close()
+
     def get_access_token(self) -> str:
         """Get a new access token from Bolt OIDC.
         
         Requests a new access token using client credentials grant type.
-        The token is used for authenticating subsequent API requests.
+        The token is used for authenticating subsequent API requests. Its
+        expiry is recorded and the token is written to the disk cache.
         
         Returns:
             str: The access token string
@@ -44,66 +366,110 @@ class Client:
         Raises:
             Exception: If the token request fails or no token is received
         """
-        logger.info("Requesting new access token from Bolt OIDC")
-        response = requests.post(
-            "https://oidc.bolt.eu/token",
-            data={
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "grant_type": "client_credentials",
-                "scope": "fleet-integration:api"
-            }
-        )
+        logger.debug("Requesting new access token from Bolt OIDC")
+        response = self._oidc_session.post(OIDC_TOKEN_URL, data=self._oidc_body, timeout=self.timeout)
         if response.status_code != 200:
-            logger.error(f"Failed to get access token: {response.status_code} {response.text}")
-            raise Exception(f"Failed to get access token: {response.status_code} {response.text}")
-        token = response.json().get("access_token")
+            body = _error_body(response)
+            logger.error("Failed to get access token: %s %s", response.status_code, body)
+            raise Exception(f"Failed to get access token: {response.status_code} {body}")
+        token_response = _parse(response)
+        token = token_response.get("access_token")
         if not token:
             raise Exception("No access token received in response")
-        logger.info("Successfully obtained access token")
+        logger.debug("Successfully obtained access token")
+        self._token_exp = _token_expiry(token, token_response)
+        _store_cached_token(self.client_id, token, self._token_exp)
         return token
     
+    def _token_valid(self) -> bool:
+        """Check whether the current access token is set and not about to expire."""
+        return _token_is_fresh(self.access_token, self._token_exp)
+    
     def _ensure_token(self):
-        """Ensure access token is set. Refresh if not configured.
+        """Ensure a valid access token is set. Refresh if missing or expiring.
         
-        Private method that checks if an access token exists. If not,
-        it automatically fetches a new token. This is called during
-        initialization and before API requests.
+        Private method that checks if an access token exists and is not
+        within `TOKEN_EXPIRY_MARGIN` seconds of its expiry. If not, it
+        automatically fetches a new token. This is called during
+        initialization and before API requests. Threads that find the token
+        expiring at the same time wait for a single refresh.
         """
-        if not self.access_token:
-            self.access_token = self.get_access_token()
+        if self._token_valid():
+            return
+        with self._refresh_lock:
+            if not self._token_valid():
+                self.access_token = self.get_access_token()
     
     def _refresh_token_if_needed(self, response) -> bool:
         """Check if token needs refresh based on response and refresh if needed.
         
         Analyzes the API response to determine if the access token has expired
-        or is invalid. If so, automatically refreshes the token.
+        or is invalid. If so, refreshes the token, unless another thread has
+        already replaced the token the request was sent with, so concurrent
+        failures caused by one expiry trigger a single refresh.
         
         Args:
             response: The HTTP response object from the API request
             
         Returns:
-            bool: True if token was refreshed, False otherwise
+            bool: True if the request should be retried with a new token,
+                False otherwise
             
         Note:
             Checks for HTTP 401 status code or response code 503 to detect
-            token expiration or invalidity.
+            token expiration or invalidity. Tokens are normally refreshed
+            before they expire, so this is a fallback for clock skew and
+            revoked tokens.
         """
-        try:
-            response_data = response.json()
-            # Check for 503 or token-related errors
-            if response.status_code == 401 or response_data.get('code') == 503:
+        if not _token_rejected(response):
+            return False
+        with self._refresh_lock:
+            if response.request.headers.get("Authorization") == f"Bearer {self.access_token}":
                 logger.warning("Access token expired or invalid, refreshing...")
                 self.access_token = self.get_access_token()
-                return True
-        except Exception:
-            # If response is not JSON or parsing fails, check status code
-            if response.status_code == 401:
-                logger.warning("Unauthorized response, refreshing token...")
-                self.access_token = self.get_access_token()
-                return True
-        return False
+        return True
     
+    def _post(self, path: str, payload: dict) -> list:
+        """POST to an API endpoint and parse the returned records.
+        
+        Sends the request with the current access token. If the token turns
+        out to be expired or invalid, refreshes it and retries once with the
+        same payload. The list validator and the key of the record list are
+        looked up in `ENDPOINTS`.
+        
+        Args:
+            path: Endpoint path relative to `base_url` (e.g. "/getDrivers")
+            payload: JSON request body
+            
+        Returns:
+            list: Parsed model instances for the returned records
+            
+        Raises:
+            Exception: If the API request fails or returns an error status code
+        """
+        records_adapter, data_key, label = ENDPOINTS[path]
+        url = self._urls[path]
+        # Encode once with orjson; Content-Type is already set on the session
+        request_body = orjson.dumps(payload)
+        self._ensure_token()
+        
+        # First attempt
+        response = self._session.post(url, data=request_body, timeout=self.timeout)
+        
+        # Refresh token if needed and retry once
+        if self._refresh_token_if_needed(response):
+            logger.debug("Retrying request with new token...")
+            response = self._session.post(url, data=request_body, timeout=self.timeout)
+        
+        if not self._logged_encoding:
+            self._logged_encoding = True
+            logger.debug("%s response Content-Encoding: %s", path, response.headers.get("Content-Encoding"))
+        if response.status_code != 200:
+            body = _error_body(response)
+            logger.error("Failed to get %s: %s %s", label, response.status_code, body)
+            raise Exception(f"Failed to get {label}: {response.status_code} {body}")
+        return records_adapter.validate_python(_parse(response).get("data", {}).get(data_key, []))
+
     def get_fleet_orders(self, offset: int, limit: int, company_ids: List[int], start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> List[FleetOrder]:
         """Get fleet orders from Bolt API with automatic token refresh.
         
@@ -130,48 +496,17 @@ class Client:
             (last 24 hours). Automatically retries the request once if token
             refresh is needed.
         """
-        self._ensure_token()
-        
         # Use default one-day interval if timestamps not provided
-        if start_ts is None:
-            start_ts = int((datetime.now() - timedelta(days=1)).timestamp())
-        if end_ts is None:
-            end_ts = int(datetime.now().timestamp())
-        
-        # First attempt
-        response = requests.post(
-            f"{self.base_url}/getFleetOrders",
-            headers={"Content-Type": "application/json", "Authorization": f"Bearer {self.access_token}"},
-            json={
-                "offset": offset,
-                "limit": limit,
-                "company_ids": company_ids,
-                "start_ts": start_ts,
-                "end_ts": end_ts,
-                "time_range_filter_type": "price_review"
-            }
-        )
+        start_ts, end_ts = _default_time_range(start_ts, end_ts)
         
-        # Refresh token if needed and retry once
-        if self._refresh_token_if_needed(response):
-            logger.info("Retrying request with new token...")
-            response = requests.post(
-                f"{self.base_url}/getFleetOrders",
-                headers={"Content-Type": "application/json", "Authorization": f"Bearer {self.access_token}"},
-                json={
-                    "offset": offset,
-                    "limit": limit,
-                    "company_ids": company_ids,
-                    "start_ts": start_ts,
-                    "end_ts": end_ts,
-                    "time_range_filter_type": "price_review"
-                }
-            )
-            
-        if response.status_code != 200:
-            logger.error(f"Failed to get fleet orders: {response.status_code} {response.text}")
-            raise Exception(f"Failed to get fleet orders: {response.status_code} {response.text}")
-        return [FleetOrder(**order) for order in response.json().get("data", {}).get("orders", [])]
+        return self._post("/getFleetOrders", {
+            "offset": offset,
+            "limit": limit,
+            "company_ids": company_ids,
+            "start_ts": start_ts,
+            "end_ts": end_ts,
+            "time_range_filter_type": "price_review"
+        })
 
     def get_vehicles(self, offset: int, limit: int, company_id: int, portal_status: PortalStatus, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> List[Vehicle]:
         """Get vehicles from Bolt API with automatic token refresh.
@@ -201,51 +536,20 @@ class Client:
             (last 24 hours). Automatically retries the request once if token
             refresh is needed.
         """
-        self._ensure_token()
-        
         # Use default one-day interval if timestamps not provided
-        if start_ts is None:
-            start_ts = int((datetime.now() - timedelta(days=1)).timestamp())
-        if end_ts is None:
-            end_ts = int(datetime.now().timestamp())
+        start_ts, end_ts = _default_time_range(start_ts, end_ts)
         
         # Handle portal_status - support both enum and direct values
-        portal_status_value = portal_status.value if hasattr(portal_status, 'value') else portal_status
+        portal_status_value = getattr(portal_status, 'value', portal_status)
         
-        # First attempt
-        response = requests.post(
-            f"{self.base_url}/getVehicles",
-            headers={"Content-Type": "application/json", "Authorization": f"Bearer {self.access_token}"},
-            json={
-                "offset": offset,
-                "limit": limit,
-                "company_id": company_id,
-                "start_ts": start_ts,
-                "end_ts": end_ts,
-                "portal_status": portal_status_value
-            }
-        )
-        
-        # Refresh token if needed and retry once
-        if self._refresh_token_if_needed(response):
-            logger.info("Retrying request with new token...")
-            response = requests.post(
-                f"{self.base_url}/getVehicles",
-                headers={"Content-Type": "application/json", "Authorization": f"Bearer {self.access_token}"},
-                json={
-                    "offset": offset,
-                    "limit": limit,
-                    "company_id": company_id,
-                    "start_ts": start_ts,
-                    "end_ts": end_ts,
-                    "portal_status": portal_status_value
-                }
-            )
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to get vehicles: {response.status_code} {response.text}")
-            raise Exception(f"Failed to get vehicles: {response.status_code} {response.text}")
-        return [Vehicle(**vehicle) for vehicle in response.json().get("data", {}).get("vehicles", [])]
+        return self._post("/getVehicles", {
+            "offset": offset,
+            "limit": limit,
+            "company_id": company_id,
+            "start_ts": start_ts,
+            "end_ts": end_ts,
+            "portal_status": portal_status_value
+        })
 
     def get_drivers(self, offset: int, limit: int, company_id: int, portal_status: PortalStatus, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> List[Driver]:
         """Get drivers from Bolt API with automatic token refresh.
@@ -275,52 +579,20 @@ class Client:
             (last 24 hours). Automatically retries the request once if token
             refresh is needed.
         """
-        self._ensure_token()
-        
         # Use default one-day interval if timestamps not provided
-        if start_ts is None:
-            start_ts = int((datetime.now() - timedelta(days=1)).timestamp())
-        if end_ts is None:
-            end_ts = int(datetime.now().timestamp())
+        start_ts, end_ts = _default_time_range(start_ts, end_ts)
         
         # Handle portal_status - support both enum and direct values
-        portal_status_value = portal_status.value if hasattr(portal_status, 'value') else portal_status
+        portal_status_value = getattr(portal_status, 'value', portal_status)
         
-        # First attempt
-        response = requests.post(
-            f"{self.base_url}/getDrivers",
-            headers={"Content-Type": "application/json", "Authorization": f"Bearer {self.access_token}"},
-            json={
-                "offset": offset,
-                "limit": limit,
-                "company_id": company_id,
-                "start_ts": start_ts,
-                "end_ts": end_ts,
-                "portal_status": portal_status_value
-            }
-        )
-        
-        # Refresh token if needed and retry once
-        if self._refresh_token_if_needed(response):
-            logger.info("Retrying request with new token...")
-            response = requests.post(
-                f"{self.base_url}/getDrivers",
-                headers={"Content-Type": "application/json", "Authorization": f"Bearer {self.access_token}"},
-                json={
-                    "offset": offset,
-                    "limit": limit,
-                    "company_id": company_id,
-                    "start_ts": start_ts,
-                    "end_ts": end_ts,
-                    "portal_status": portal_status_value
-                }
-            )
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to get drivers: {response.status_code} {response.text}")
-            raise Exception(f"Failed to get drivers: {response.status_code} {response.text}")
-        return [Driver(**driver) for driver in response.json().get("data", {}).get("drivers", [])]
-
+        return self._post("/getDrivers", {
+            "offset": offset,
+            "limit": limit,
+            "company_id": company_id,
+            "start_ts": start_ts,
+            "end_ts": end_ts,
+            "portal_status": portal_status_value
+        })
 
     def get_fleet_state_logs(self, offset: int, limit: int, company_id: int, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> List[FleetStateLog]:
         """Get fleet state logs from Bolt API with automatic token refresh.
@@ -350,52 +622,105 @@ class Client:
             (last 24 hours). Automatically retries the request once if token
             refresh is needed.
         """
-        self._ensure_token()
-        
         # Use default one-day interval if timestamps not provided
-        if start_ts is None:
-            start_ts = int((datetime.now() - timedelta(days=1)).timestamp())
-        if end_ts is None:
-            end_ts = int(datetime.now().timestamp())
+        start_ts, end_ts = _default_time_range(start_ts, end_ts)
         
-        # First attempt
-        response = requests.post(
-            f"{self.base_url}/getFleetStateLogs",
-            headers={"Content-Type": "application/json", "Authorization": f"Bearer {self.access_token}"},
-            json={
-                "offset": offset,
-                "limit": limit,
-                "company_id": company_id,
-                "start_ts": start_ts,
-                "end_ts": end_ts
-            }
-        )
+        return self._post("/getFleetStateLogs", {
+            "offset": offset,
+            "limit": limit,
+            "company_id": company_id,
+            "start_ts": start_ts,
+            "end_ts": end_ts
+        })
+
+    def _fetch_all_pages(self, fetch_page: Callable[[int], list], page_size: int, max_workers: int) -> list:
+        """Fetch every page of a paginated endpoint using a thread pool.
         
-        # Refresh token if needed and retry once
-        if self._refresh_token_if_needed(response):
-            logger.info("Retrying request with new token...")
-            response = requests.post(
-                f"{self.base_url}/getFleetStateLogs",
-                headers={"Content-Type": "application/json", "Authorization": f"Bearer {self.access_token}"},
-                json={
-                    "offset": offset,
-                    "limit": limit,
-                    "company_id": company_id,
-                    "start_ts": start_ts,
-                    "end_ts": end_ts
-                }
-            )
+        The API does not report a total count, so the first page is fetched
+        on its own and, if it is full, further pages are requested in waves
+        of `max_workers` concurrent requests until a short page is returned.
         
-        if response.status_code != 200:
-            logger.error(f"Failed to get fleet state logs: {response.status_code} {response.text}")
-            raise Exception(f"Failed to get fleet state logs: {response.status_code} {response.text}")
-        return [FleetStateLog(**log) for log in response.json().get("data", {}).get("state_logs", [])]
+        Args:
+            fetch_page: Callable returning the records at the given offset
+            page_size: Number of records requested per page
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            list: All records, in offset order
+            
+        Raises:
+            ValueError: If page_size or max_workers is not positive
+        """
+        if page_size <= 0:
+            raise ValueError(f"page_size must be positive, got {page_size}")
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        # Make sure the connection pool doesn't serialize the workers
+        self._ensure_pool_size(max_workers * 2)
+        # Fetch the token once up front rather than racing for it in the workers
+        self._ensure_token()
+        
+        pages = [fetch_page(0)]
+        offset = page_size
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while len(pages[-1]) == page_size:
+                offsets = range(offset, offset + page_size * max_workers, page_size)
+                for page in executor.map(fetch_page, offsets):
+                    pages.append(page)
+                    if len(page) < page_size:
+                        break
+                offset += page_size * max_workers
+        return list(chain.from_iterable(pages))
+
+    def get_all_fleet_orders(self, company_ids: List[int], start_ts: Optional[int] = None, end_ts: Optional[int] = None, page_size: int = 500, max_workers: int = 8) -> List[FleetOrder]:
+        """Get all fleet orders in a time range, fetching pages concurrently.
+        
+        Walks the offset/limit pagination of `get_fleet_orders` with up to
+        `max_workers` requests in flight at once, instead of one page after
+        another.
+        
+        Args:
+            company_ids: List of company IDs to filter orders
+            start_ts: Start timestamp (Unix timestamp in seconds). Defaults to
+                24 hours ago if not provided.
+            end_ts: End timestamp (Unix timestamp in seconds). Defaults to
+                current time if not provided.
+            page_size: Number of orders requested per page
+            max_workers: Maximum number of concurrent requests
+                
+        Returns:
+            List[FleetOrder]: All matching orders, in API order
+            
+        Raises:
+            ValueError: If page_size or max_workers is not positive
+            Exception: If any of the API requests fails
+        """
+        # Pin the time range so every page queries the same window
+        start_ts, end_ts = _default_time_range(start_ts, end_ts)
+        return self._fetch_all_pages(
+            lambda offset: self.get_fleet_orders(offset, page_size, company_ids, start_ts, end_ts),
+            page_size,
+            max_workers
+        )
+
+
+_default_client: Optional[Client] = None
+_default_client_lock = threading.Lock()
 
 
 def create_client() -> Client:
-    """Create a new Client instance.
+    """Get the shared Client instance, creating it on first use.
+    
+    Every call returns the same client, so its session, connection pool
+    and access token are reused. Instantiate `Client` directly if you need
+    an isolated client.
     
     Returns:
-        Client: A new Client instance
+        Client: The shared Client instance
     """
-    return Client()
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = Client()
+    return _default_client
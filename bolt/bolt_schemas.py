@@ -1,8 +1,13 @@
-from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic.dataclasses import dataclass
 from typing import Optional, List
-from uuid import UUID
 from enum import Enum
 
+# Records are parsed in bulk, so they are slotted dataclasses rather than
+# BaseModels: no per-instance __dict__, which cuts memory for large fetches.
+# Unknown fields returned by the API are ignored.
+_record = dataclass(slots=True, config=ConfigDict(extra="ignore"))
+
 # ========================================
 # Generic Schemas
 # ========================================
@@ -14,14 +19,16 @@ class PortalStatus(Enum):
 # ========================================
 # Order Schemas
 # ========================================
-class OrderStop(BaseModel):
+@_record
+class OrderStop:
     lat: Optional[float] = None
     lng: Optional[float] = None
     real_lat: Optional[float] = None
     real_lng: Optional[float] = None
     type: Optional[str] = None
 
-class OrderPrice(BaseModel):
+@_record
+class OrderPrice:
     booking_fee: Optional[float] = None
     cancellation_fee: Optional[float] = None
     cash_discount: Optional[float] = None
@@ -32,7 +39,8 @@ class OrderPrice(BaseModel):
     toll_fee: Optional[float] = None
     ride_price: Optional[float] = None
 
-class FleetOrder(BaseModel):
+@_record
+class FleetOrder:
     order_reference: Optional[str] = None
     driver_name: Optional[str] = None
     payment_method: Optional[str] = None
@@ -57,21 +65,23 @@ class FleetOrder(BaseModel):
 # ========================================
 # Vehicle Schemas
 # ========================================
-class Vehicle(BaseModel):
+@_record
+class Vehicle:
     id: int
     model: str
     year: int
     reg_number: str
-    uuid: UUID
+    uuid: str
     state: PortalStatus
 
 
 # ========================================
 # Driver Schemas
 # ========================================
-class Driver(BaseModel):
-    driver_uuid: UUID
-    partner_uuid: UUID
+@_record
+class Driver:
+    driver_uuid: str
+    partner_uuid: str
     first_name: str
     last_name: str
     email: str
@@ -82,10 +92,11 @@ class Driver(BaseModel):
 # ========================================
 # Fleet State Log Schemas
 # ========================================
-class FleetStateLog(BaseModel):
+@_record
+class FleetStateLog:
     created: int
     state: str
-    driver_uuid: UUID
-    vehicle_uuid: UUID
+    driver_uuid: str
+    vehicle_uuid: str
     lat: float
     lng: float
\ No newline at end of file